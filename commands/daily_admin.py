@@ -11,25 +11,39 @@ import discord
 import web_search
 from .shared import log_error
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from paths import DAILY_CONFIG_PATH, DAILY_HISTORY_PATH
 DAILY_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
 
-
-
 def load_json(path: Path) -> dict:
     if not path.exists():
         return {}
     try:
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
         with path.open("r", encoding="utf-8") as f:
             return json.load(f)
     except json.JSONDecodeError:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError.
         return {}
 
 
-def save_json(path: Path, data: dict) -> None:
+def save_json(path: Path, data: dict, *, pretty: bool = False) -> None:
+    # Only the hand-edited config is pretty-printed; history is rewritten on
+    # every post and grows without bound, so keep it compact.
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+        return
     with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        if pretty:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        else:
+            json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
 
 
 def get_daily_cfg(guild_id: int) -> dict:
@@ -42,7 +56,7 @@ def get_daily_cfg(guild_id: int) -> dict:
 def save_daily_cfg(guild_id: int, data: dict) -> None:
     cfg = load_json(DAILY_CONFIG_PATH)
     cfg[str(guild_id)] = data
-    save_json(DAILY_CONFIG_PATH, cfg)
+    save_json(DAILY_CONFIG_PATH, cfg, pretty=True)
 
 
 def get_daily_history(guild_id: int) -> list[dict]:
@@ -64,6 +78,7 @@ async def post_daily_word(channel: discord.TextChannel, guild_id: int) -> bool:
 
     exclude_urls = web_search.urls_used_within_days(history, days=365)
 
+    # Served from web_search's in-memory index; files are only re-read when they change.
     handspeak_entries = web_search.load_dictionary_entries(web_search.HAND_SPEAK_DICT_PATH)
     lifeprint_entries = web_search.load_dictionary_entries(web_search.LIFEPRINT_DICT_PATH)
 
@@ -80,8 +95,9 @@ async def post_daily_word(channel: discord.TextChannel, guild_id: int) -> bool:
 
     await channel.send(message)
 
-    now = datetime.now(timezone.utc).isoformat()
-    history_items = [{"ts": now, **u} for u in used]
+    now = datetime.now(timezone.utc)
+    # "epoch" lets the history checks compare ints instead of parsing "ts".
+    history_items = [{"ts": now.isoformat(), "epoch": int(now.timestamp()), **u} for u in used]
     append_daily_history(guild_id, history_items)
     return True
 
@@ -1,39 +1,81 @@
 from __future__ import annotations
 
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 
 import discord
 from discord.ext import commands
 
 from .shared import log_error
 
+# Developer server + channel that receives feedback threads.
+FEEDBACK_GUILD_ID = 1469744304711930145
+FEEDBACK_CHANNEL_NAME = "feedback"
+
+# (utc_day_number, "YYYY-MM-DD") for the current UTC day.
+_today_cache: tuple[int, str] = (-1, "")
+
+
+def _today() -> str:
+    global _today_cache
+    day = int(time.time() // 86400)
+    if _today_cache[0] != day:
+        _today_cache = (day, f"{datetime.now(timezone.utc):%Y-%m-%d}")
+    return _today_cache[1]
+
+
+# thread name -> thread id, so only the first feedback of the day looks it up.
+_feedback_thread_cache: dict[str, int] = {}
+
 
 class Feedback(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self._feedback_channel: discord.TextChannel | None = None
+
+    def _find_feedback_channel(self) -> discord.TextChannel | None:
+        target_guild = self.bot.get_guild(FEEDBACK_GUILD_ID)
+        if not target_guild:
+            return None
+        return discord.utils.get(target_guild.text_channels, name=FEEDBACK_CHANNEL_NAME)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        self._feedback_channel = self._find_feedback_channel()
 
     @commands.hybrid_command(name="feedback", description="Send feedback to the bot developer")
     async def feedback(self, ctx: commands.Context, *, message: str):
         try:
-            bot_guild_id = 1469744304711930145
-            target_guild = ctx.bot.get_guild(bot_guild_id)
-
-            if not target_guild:
-                await ctx.send("Target guild not found.")
-                return
+            channel = self._feedback_channel
+            if channel is None:
+                if not ctx.bot.get_guild(FEEDBACK_GUILD_ID):
+                    await ctx.send("Target guild not found.")
+                    return
+
+                channel = self._find_feedback_channel()
+                if not channel:
+                    await ctx.send("Feedback channel not found.")
+                    return
+                self._feedback_channel = channel
+
+            thread_name = f"Feedback - {_today()}"
+            thread = None
+            cached_id = _feedback_thread_cache.get(thread_name)
+            if cached_id is not None:
+                thread = channel.guild.get_thread(cached_id)
 
-            channel = discord.utils.get(target_guild.text_channels, name="feedback")
-            if not channel:
-                await ctx.send("Feedback channel not found.")
-                return
-
-            thread_name = f"Feedback - {datetime.now():%Y-%m-%d}"
-            thread = discord.utils.get(channel.threads, name=thread_name)
+            if not thread:
+                thread = discord.utils.get(channel.threads, name=thread_name)
 
             if not thread:
                 starter = await channel.send(thread_name)
                 thread = await starter.create_thread(name=thread_name, auto_archive_duration=1440)
 
+            if cached_id != thread.id:
+                # Only today's thread is ever needed again.
+                _feedback_thread_cache.clear()
+                _feedback_thread_cache[thread_name] = thread.id
+
             guild_name = ctx.guild.name if ctx.guild else "Direct Message"
             guild_id = ctx.guild.id if ctx.guild else "N/A"
 
@@ -48,6 +90,9 @@ class Feedback(commands.Cog):
 
         except Exception:
             log_error()
+            # The channel or thread may have been deleted; look both up again next time.
+            self._feedback_channel = None
+            _feedback_thread_cache.clear()
             await ctx.send("⚠️ Failed to send feedback.")
 
 
@@ -7,11 +7,11 @@ from typing import Optional, Iterable, List
 import discord
 from discord.ext import commands
 
-from paths import ERROR_HANDLING_LOG_PATH
+from paths import ERROR_HANDLING_LOG_PATH, ERROR_HANDLING_LOG_STR
 ERROR_HANDLING_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
 def log_error() -> None:
-    with ERROR_HANDLING_LOG_PATH.open("a", encoding="utf-8") as f:
+    with open(ERROR_HANDLING_LOG_STR, "a", encoding="utf-8") as f:
         f.write(traceback.format_exc() + "\n")
 
 def brand_embed(
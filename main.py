@@ -1,17 +1,25 @@
+import asyncio
+import atexit
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 
+import web_search
+from paths import DISCORD_LOG_PATH, DISCORD_LOG_STR
+
 # Load environment variables from .env into the process.
 load_dotenv()
 
 TOKEN = os.getenv("DISCORD_TOKEN")
 
 # Your personal/dev guild for fast command iteration + receiving reports
-DEV_GUILD_ID = os.getenv("DEV_GUILD_ID", "1469744304711930145")
+DEV_GUILD_ID = int(os.getenv("DEV_GUILD_ID", "1469744304711930145"))
+_DEV_GUILD_OBJ = discord.Object(id=DEV_GUILD_ID)
 
 
 # Channel IDs for forums to post to.
@@ -23,11 +31,16 @@ if APP_ID is None:
     raise RuntimeError("DISCORD_APP_ID is missing. Put it in your .env as a number.")
 
 # Configure a log file for Discord internals.
-from paths import DISCORD_LOG_PATH
 DISCORD_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-handler = logging.FileHandler(filename=str(DISCORD_LOG_PATH), encoding="utf-8", mode="w")
-discord.utils.setup_logging(handler=handler, level=logging.INFO)
+handler = logging.FileHandler(filename=DISCORD_LOG_STR, encoding="utf-8", mode="w")
+
+# The event loop only enqueues records; a listener thread does the file writes.
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+discord.utils.setup_logging(handler=QueueHandler(log_queue), level=logging.INFO)
 
 # Enable message content intent so text commands can be read.
 intents = discord.Intents.default()
@@ -41,6 +54,8 @@ NUKE_GLOBAL = os.getenv("NUKE_GLOBAL_COMMANDS", "0") == "1"
 
 
 class MyBot(commands.Bot):
+    # Command tree syncs live here, not in on_ready: setup_hook runs once per
+    # process, while on_ready fires again on every gateway reconnect.
     async def setup_hook(self):
         print("loading extension...")
         await self.load_extension("commands")
@@ -62,30 +77,32 @@ class MyBot(commands.Bot):
             print("ℹ️ Global sync skipped. Set SYNC_GLOBAL_COMMANDS=1 to enable.")
 
         # ✅ Dev guild sync (fast iteration & instant updates in your dev server)
-        dev_guild = discord.Object(id=DEV_GUILD_ID)
-        self.tree.clear_commands(guild=dev_guild)
-        self.tree.copy_global_to(guild=dev_guild)
-        await self.tree.sync(guild=dev_guild)
+        self.tree.clear_commands(guild=_DEV_GUILD_OBJ)
+        self.tree.copy_global_to(guild=_DEV_GUILD_OBJ)
+        await self.tree.sync(guild=_DEV_GUILD_OBJ)
         print(f"✅ Clean synced commands to dev guild {DEV_GUILD_ID}")
 
+    async def close(self):
+        await web_search.close_http_session()
+        await super().close()
+
 
-bot = MyBot(
-    command_prefix="!",
-    intents=intents,
-    help_command=None,
-    application_id=APP_ID,
-    case_insensitive=True,
-)
+def build_bot() -> MyBot:
+    return MyBot(
+        command_prefix="!",
+        intents=intents,
+        help_command=None,
+        application_id=APP_ID,
+        case_insensitive=True,
+    )
 
 
 async def main():
-    async with bot:
+    async with build_bot() as bot:
         await bot.start(TOKEN)
 
 
 if __name__ == "__main__":
-    import asyncio
-
     if os.name == "nt":
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
@@ -93,12 +110,3 @@ if __name__ == "__main__":
         asyncio.run(main())
     except KeyboardInterrupt:
         print("Bot shutdown requested. Exiting cleanly.")
-
-
-@bot.event
-async def on_command_error(ctx, error):
-    if isinstance(error, commands.CommandNotFound):
-        print(f"Bot didn't respond to: {ctx.message.content}")
-        await ctx.send("Command doesn't exist.")
-    else:
-        print(f"Command Error: {error}")
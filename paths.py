@@ -19,3 +19,5 @@ DAILY_HISTORY_PATH = DAILY_DIR / "daily-word-history.json"
 # Files (logs)
 DISCORD_LOG_PATH = ERROR_LOGS_DIR / "discord.log"
 ERROR_HANDLING_LOG_PATH = ERROR_LOGS_DIR / "discord-error-handling.log"
+DISCORD_LOG_STR = str(DISCORD_LOG_PATH)
+ERROR_HANDLING_LOG_STR = str(ERROR_HANDLING_LOG_PATH)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import random
-from datetime import datetime, timezone, timedelta
+from itertools import chain
+from datetime import datetime, time, timezone, timedelta
 from typing import Dict, Iterable, Optional, Tuple, List, Set
 
 # We expect search_all_providers to exist in your lookup module.
@@ -12,13 +13,50 @@ except Exception:  # pragma: no cover
     search_all_providers = None
 
 
+def _is_utc_iso(ts: str) -> bool:
+    # Shape written by the bot: YYYY-MM-DDTHH:MM:SS[.ffffff]+00:00. These sort
+    # and compare correctly as plain strings, so they need no parsing.
+    return len(ts) >= 25 and ts[4] == "-" and ts[7] == "-" and ts[10] == "T" and ts.endswith("+00:00")
+
+
+def _newest_first(history: Iterable[Dict]) -> Iterable[Dict]:
+    # History is appended as words are posted, so it is oldest-first.
+    return reversed(history if isinstance(history, list) else list(history))
+
+
+def _item_epoch(item: Dict) -> Optional[int]:
+    # Unix seconds stored next to "ts" by newer history records.
+    epoch = item.get("epoch")
+    if isinstance(epoch, int) and not isinstance(epoch, bool):
+        return epoch
+    return None
+
+
 def has_posted_today(history: Iterable[Dict]) -> bool:
     today = datetime.now(timezone.utc).date()
+    today_iso = today.isoformat()
+    today_start = int(datetime.combine(today, time.min, tzinfo=timezone.utc).timestamp())
+    tomorrow_start = today_start + 86400
+
+    # Today's posts are at the tail; stop at the first older one.
+    for item in _newest_first(history):
+        epoch = _item_epoch(item)
+        if epoch is not None:
+            if today_start <= epoch < tomorrow_start:
+                return True
+            if epoch < today_start:
+                break
+            continue
 
-    for item in history:
         ts = item.get("ts")
         if not ts:
             continue
+        if isinstance(ts, str) and _is_utc_iso(ts):
+            if ts[:10] == today_iso:
+                return True
+            if ts[:10] < today_iso:
+                break
+            continue
         try:
             when = datetime.fromisoformat(ts)
         except ValueError:
@@ -27,52 +65,80 @@ def has_posted_today(history: Iterable[Dict]) -> bool:
             when = when.replace(tzinfo=timezone.utc)
         if when.date() == today:
             return True
+        if when.date() < today:
+            break
 
     return False
 
 
 def urls_used_within_days(history: Iterable[Dict], days: int = 365) -> Set[str]:
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    cutoff_iso = cutoff.isoformat()
+    cutoff_epoch = int(cutoff.timestamp())
     used: Set[str] = set()
 
-    for item in history:
+    # Walk back from the newest post and stop once past the cutoff.
+    for item in _newest_first(history):
         url = item.get("url")
-        ts = item.get("ts")
         if not isinstance(url, str) or not url:
             continue
+
+        epoch = _item_epoch(item)
+        if epoch is not None:
+            if epoch < cutoff_epoch:
+                break
+            used.add(url)
+            continue
+
+        ts = item.get("ts")
         if not isinstance(ts, str) or not ts:
             continue
+        if _is_utc_iso(ts):
+            if ts < cutoff_iso:
+                break
+            used.add(url)
+            continue
         try:
             when = datetime.fromisoformat(ts)
         except ValueError:
             continue
         if when.tzinfo is None:
             when = when.replace(tzinfo=timezone.utc)
-        if when >= cutoff:
-            used.add(url)
+        if when < cutoff:
+            break
+        used.add(url)
 
     return used
 
 
-def choose_random_unused(entries: List[Dict], *, exclude_urls: Set[str]) -> Optional[Dict]:
-    candidates = [e for e in entries if isinstance(e.get("url"), str) and e["url"] and e["url"] not in exclude_urls]
-    if not candidates:
-        return None
-    return random.choice(candidates)
+def choose_random_unused(entries: Iterable[Dict], *, exclude_urls: Set[str]) -> Optional[Dict]:
+    # Single-pass reservoir sample (k=1): uniform over eligible entries without
+    # building a filtered candidates list.
+    chosen: Optional[Dict] = None
+    seen = 0
+
+    for e in entries:
+        url = e.get("url")
+        if not isinstance(url, str) or not url or url in exclude_urls:
+            continue
+        seen += 1
+        if random.random() * seen < 1.0:
+            chosen = e
+
+    return chosen
 
 
 async def build_daily_word_post(
     *,
-    handspeak_entries: List[Dict],
-    lifeprint_entries: List[Dict],
+    handspeak_entries: Iterable[Dict],
+    lifeprint_entries: Iterable[Dict],
     exclude_urls: Set[str],
     history: Optional[Iterable[Dict]] = None,
 ) -> Tuple[str, List[Dict]]:
     if history and has_posted_today(history):
         return "Daily word already posted today.", []
 
-    combined = list(handspeak_entries) + list(lifeprint_entries)
-    anchor = choose_random_unused(combined, exclude_urls=exclude_urls)
+    anchor = choose_random_unused(chain(handspeak_entries, lifeprint_entries), exclude_urls=exclude_urls)
 
     if anchor is None:
         return (
@@ -3,18 +3,32 @@ from __future__ import annotations
 import json
 import asyncio
 import aiohttp
+import mmap
+import re
 import string
-import time
 import os
 import tempfile
+import threading
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
+from html import unescape
 from typing import Dict, Iterable, Literal, Optional, Tuple
 from urllib.parse import quote, quote_plus, urljoin, urlparse
 
-import requests
 from bs4 import BeautifulSoup
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover
+    LexborHTMLParser = None
+
 # Define JSONL dictionary storage paths used by the bot.
 HAND_SPEAK_DICT_PATH = "dictionaries/handspeak-dict.txt"
 LIFEPRINT_DICT_PATH = "dictionaries/lifeprint-dict.txt"
@@ -23,6 +37,25 @@ ON_DEMAND_DICT_PATH = "dictionaries/ondemand-dict.txt"
 # Configure web fetch pacing and stop conditions.
 REQUEST_DELAY_SECONDS = 0.5
 MAX_CONSECUTIVE_404 = 3
+UPDATER_TIMEOUT_SECONDS = 20
+
+# Handspeak ids are fetched in windows, with a cap on requests in flight.
+HAND_SPEAK_BATCH_SIZE = 64
+HAND_SPEAK_MAX_CONCURRENCY = 16
+
+# Lifeprint letter index pages are fetched concurrently, capped per host.
+LIFEPRINT_MAX_CONCURRENCY = 8
+
+# Bound live provider lookups so one slow site can't stall /sign.
+LIVE_SEARCH_TIMEOUT_SECONDS = 10
+LIVE_SEARCH_MAX_CONNECTIONS = 32
+LIVE_SEARCH_MAX_CONNECTIONS_PER_HOST = 8
+LIVE_SEARCH_KEEPALIVE_SECONDS = 60
+# Minimum spacing between live requests to the same host; other hosts never wait.
+LIVE_SEARCH_MIN_HOST_INTERVAL_SECONDS = 0.25
+
+# lxml is a C parser and much faster than the pure-Python "html.parser".
+HTML_PARSER = "lxml"
 
 # Send a stable user-agent so sites can identify this updater.
 HEADERS = {
@@ -57,6 +90,73 @@ def _provider_sort_key(provider: str) -> tuple[int, str]:
     return (_PROVIDER_RANK.get(p, 999), p)
 
 
+# =============================
+# Shared HTTP Session
+# =============================
+
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+class _HostThrottle:
+    """
+    Spaces requests to the same host at least `interval` seconds apart. Each
+    caller reserves the next free slot for its host up front, so concurrent
+    callers queue in arrival order without a lock.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_slot: Dict[str, float] = {}
+
+    async def wait(self, host: str) -> None:
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot.get(host, 0.0))
+        self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+_live_throttle = _HostThrottle(LIVE_SEARCH_MIN_HOST_INTERVAL_SECONDS)
+
+
+@asynccontextmanager
+async def _throttled_get(session: aiohttp.ClientSession, url: str, **kwargs):
+    """
+    session.get for live provider lookups, after the per-host throttle. The
+    wait happens before the request exists, so it never eats into the
+    session's LIVE_SEARCH_TIMEOUT_SECONDS.
+    """
+    await _live_throttle.wait(urlparse(url).hostname or "")
+    async with session.get(url, **kwargs) as resp:
+        yield resp
+
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """
+    Returns the process-wide aiohttp session used for live provider lookups.
+    Reusing it keeps connections (and TLS sessions) alive between /sign calls.
+    """
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            headers=HEADERS,
+            timeout=aiohttp.ClientTimeout(total=LIVE_SEARCH_TIMEOUT_SECONDS),
+            connector=aiohttp.TCPConnector(
+                limit=LIVE_SEARCH_MAX_CONNECTIONS,
+                limit_per_host=LIVE_SEARCH_MAX_CONNECTIONS_PER_HOST,
+                keepalive_timeout=LIVE_SEARCH_KEEPALIVE_SECONDS,
+            ),
+        )
+    return _http_session
+
+
+async def close_http_session() -> None:
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+
 # =============================
 # Single Logging Function (ONLY)
 # =============================
@@ -80,32 +180,54 @@ def _log_provider(provider: str, message: str) -> None:
 # JSONL Helpers
 # =============================
 
-def _iter_jsonl(path: str) -> Iterable[Dict]:
+def _decode_record(line: bytes):
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _iter_jsonl(path: str, start: int = 0, end: Optional[int] = None) -> Iterable[Dict]:
+    """
+    Yields the dict records in `path`, from byte `start` up to byte `end`
+    (default: end of file). A line running past `end` is cut off at `end`.
+    """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return
+
+    with f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file: nothing to map.
+            return
+
+        with mm:
+            limit = len(mm) if end is None else min(end, len(mm))
+            mm.seek(start)
+            while mm.tell() < limit:
+                line = mm.readline()
+                overrun = mm.tell() - limit
+                if overrun > 0:
+                    line = line[:-overrun]
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    obj = json.loads(line)
-                except json.JSONDecodeError:
+                    obj = _decode_record(line)
+                except ValueError:
+                    # json/orjson decode errors and bad UTF-8 are all ValueErrors.
                     continue
                 if isinstance(obj, dict):
                     yield obj
-    except FileNotFoundError:
-        return
 
 
-def _append_jsonl(path: str, obj: Dict) -> None:
+def _order_record(obj: Dict) -> Dict:
     """
-    Append one dictionary object as a single JSONL line.
     Forces a consistent key order for readability:
       title, url, then any remaining keys alphabetically.
     """
-    if not isinstance(obj, dict):
-        return
-
     ordered: Dict = {}
     if "title" in obj:
         ordered["title"] = obj.get("title")
@@ -117,19 +239,294 @@ def _append_jsonl(path: str, obj: Dict) -> None:
             continue
         ordered[k] = obj.get(k)
 
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(ordered, ensure_ascii=False) + "\n")
+    return ordered
+
+
+def _encode_record(obj: Dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _sync_and_close(f) -> None:
+    try:
+        f.flush()
+        os.fsync(f.fileno())
+    finally:
+        f.close()
+
+
+@asynccontextmanager
+async def _jsonl_writer(path: str):
+    """
+    Opens `path` once for a bulk update and yields a write(obj) function.
+    Records are buffered and reach the file in 64 KiB chunks instead of one
+    open/write/close per record. On a clean exit they are fsynced once, in a
+    worker thread so the event loop never waits on the disk; if the block
+    raises, the file is just closed and the original error propagates.
+    The cached index for `path` goes stale and catches up on next use.
+    """
+    f = open(path, "ab", buffering=1 << 16)
+
+    def write(obj: Dict) -> None:
+        if isinstance(obj, dict):
+            f.write(_encode_record(_order_record(obj)))
+
+    try:
+        yield write
+    except BaseException:
+        with suppress(OSError):
+            f.close()
+        raise
+
+    await asyncio.to_thread(_sync_and_close, f)
+
+
+def _load_sidecar(path: str) -> Dict:
+    """Small JSON object stored next to a dictionary; {} if missing or bad."""
+    try:
+        with open(path, "rb") as f:
+            data = _decode_record(f.read())
+    except (FileNotFoundError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_sidecar(path: str, data: Dict) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_encode_record(data))
+    os.replace(tmp_path, path)
 
 
-def _get_saved_urls(path: str) -> set[str]:
-    saved = set()
-    for obj in _iter_jsonl(path):
-        url = obj.get("url")
-        if isinstance(url, str) and url:
-            saved.add(url)
+def _get_saved_urls(path: str) -> set[bytes]:
+    """
+    URLs already saved in `path`, as UTF-8 bytes. Lines that can't hold a
+    "url" key are skipped without being decoded.
+    """
+    saved: set[bytes] = set()
+    try:
+        with open(path, "rb") as f:
+            for line in f:
+                if b'"url"' not in line:
+                    continue
+                try:
+                    obj = _decode_record(line)
+                except ValueError:
+                    continue
+                url = obj.get("url") if isinstance(obj, dict) else None
+                if isinstance(url, str) and url:
+                    saved.add(url.encode())
+    except FileNotFoundError:
+        pass
     return saved
 
 
+# =============================
+# Local Dictionary Index
+# =============================
+
+@dataclass
+class _DictIndex:
+    stamp: Optional[Tuple[int, int]]
+    # First bytes of the file when indexed, to tell appends from rewrites.
+    head: bytes
+    records: list[Dict]
+    # Parallel columns over records whose cleaned title and url are non-empty,
+    # in file order. titles_norm is _normalize_title(title), computed once.
+    titles: list[str]
+    titles_norm: list[str]
+    urls: list[str]
+    row_records: list[Dict]
+    # Records whose title and url are non-empty strings (load_dictionary_entries).
+    entries: list[Dict]
+    by_title: Dict[str, list[Dict]]
+    # First _WORD_START_KEY_LEN chars at every word start of titles_norm ->
+    # ascending row numbers. Narrows word-start searches to candidate rows.
+    word_starts: Dict[str, list[int]]
+
+
+# path -> index, refreshed only when the file's (mtime, size) changes.
+_DICT_CACHE: Dict[str, _DictIndex] = {}
+# Searches load indexes from worker threads as well as the event loop; only
+# one of them may refresh (and possibly extend) an index at a time.
+_DICT_CACHE_LOCK = threading.Lock()
+
+_INDEX_HEAD_BYTES = 256
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+# Same word boundary as _query_start_pattern; captures the key at each start.
+_WORD_START_KEY_LEN = 3
+_WORD_START_KEY_RE = re.compile(r"(?<![a-z0-9])(?=(.{%d}))" % _WORD_START_KEY_LEN, re.S)
+
+
+def _title_keys(title: str) -> set[str]:
+    # Same slash-split + normalization as _matches_title.
+    return {_normalize_title(part) for part in title.split("/")}
+
+
+def _clean_title_url(obj: Dict) -> Tuple[str, str]:
+    return str(obj.get("title", "")).strip(), str(obj.get("url", "")).strip()
+
+
+def _index_record(index: _DictIndex, obj: Dict) -> None:
+    index.records.append(obj)
+
+    title, url = _clean_title_url(obj)
+    if title and url:
+        row = len(index.titles_norm)
+        title_norm = _normalize_title(title)
+        index.titles.append(title)
+        index.urls.append(url)
+        index.row_records.append(obj)
+        # Readers size their scans by titles_norm, so it grows last: a row
+        # they can see already exists in every other column.
+        index.titles_norm.append(title_norm)
+
+        for key in _WORD_START_KEY_RE.findall(title_norm):
+            rows = index.word_starts.setdefault(key, [])
+            if not rows or rows[-1] != row:
+                rows.append(row)
+
+    raw_title = obj.get("title")
+    raw_url = obj.get("url")
+    if isinstance(raw_title, str) and isinstance(raw_url, str) and raw_title and raw_url:
+        index.entries.append(obj)
+
+    for key in _title_keys(str(obj.get("title", ""))):
+        index.by_title.setdefault(key, []).append(obj)
+
+
+def _read_head(path: str, size: int) -> bytes:
+    try:
+        with open(path, "rb") as f:
+            return f.read(min(size, _INDEX_HEAD_BYTES))
+    except FileNotFoundError:
+        return b""
+
+
+def _appended_from(path: str, cached: _DictIndex, stamp: Optional[Tuple[int, int]]) -> Optional[int]:
+    """
+    Offset of the bytes appended to `path` since `cached` was built, or None
+    when the file may have been rewritten and needs a full re-read.
+    """
+    if cached.stamp is None or stamp is None:
+        return None
+    old_size = cached.stamp[1]
+    if stamp[1] <= old_size:
+        return None
+
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(cached.head)) != cached.head:
+                return None
+            if old_size:
+                # Resume only after a complete line, never inside one.
+                f.seek(old_size - 1)
+                if f.read(1) != b"\n":
+                    return None
+    except FileNotFoundError:
+        return None
+    return old_size
+
+
+def _load_index(path: str) -> _DictIndex:
+    cached = _DICT_CACHE.get(path)
+    if cached is not None and cached.stamp == _file_stamp(path):
+        return cached
+
+    with _DICT_CACHE_LOCK:
+        # Another thread may have refreshed it while this one waited.
+        stamp = _file_stamp(path)
+        cached = _DICT_CACHE.get(path)
+        if cached is not None and cached.stamp == stamp:
+            return cached
+        return _refresh_index(path, cached, stamp)
+
+
+def _refresh_index(path: str, cached: Optional[_DictIndex], stamp: Optional[Tuple[int, int]]) -> _DictIndex:
+    end = stamp[1] if stamp is not None else None
+
+    # Append-only growth (the updaters' bulk writes) only parses the new tail.
+    start = _appended_from(path, cached, stamp) if cached is not None else None
+    if start is not None:
+        for obj in _iter_jsonl(path, start=start, end=end):
+            _index_record(cached, obj)
+        cached.stamp = stamp
+        return cached
+
+    index = _DictIndex(
+        stamp=stamp,
+        head=_read_head(path, end or 0),
+        records=[],
+        titles=[],
+        titles_norm=[],
+        urls=[],
+        row_records=[],
+        entries=[],
+        by_title={},
+        word_starts={},
+    )
+    for obj in _iter_jsonl(path, end=end):
+        _index_record(index, obj)
+
+    _DICT_CACHE[path] = index
+    return index
+
+
+# =============================
+# HTML Helpers
+# =============================
+# The updaters and the link-picking providers use selectolax (Lexbor, C) when
+# it is installed and fall back to BeautifulSoup otherwise.
+
+def _parse_html(html: str):
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(html)
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+def _css_first(doc, selector: str):
+    if LexborHTMLParser is not None:
+        return doc.css_first(selector)
+    return doc.select_one(selector)
+
+
+def _css_all(doc, selector: str) -> list:
+    if LexborHTMLParser is not None:
+        return doc.css(selector)
+    return doc.select(selector)
+
+
+def _node_attr(node, name: str) -> str:
+    if LexborHTMLParser is not None:
+        return node.attributes.get(name) or ""
+    value = node.get(name, "")
+    return " ".join(value) if isinstance(value, list) else value
+
+
+def _node_text(node) -> str:
+    if LexborHTMLParser is not None:
+        return node.text(strip=True)
+    return node.get_text(strip=True)
+
+
+def _page_text(doc) -> str:
+    """Lowercased visible text of the page, for no-result phrase checks."""
+    if LexborHTMLParser is not None:
+        doc.strip_tags(["script", "style"])
+        return doc.root.text(separator=" ", strip=True).lower() if doc.root else ""
+    return doc.get_text(" ", strip=True).lower()
+
+
 # =============================
 # Handspeak Local Dictionary Builder
 # =============================
@@ -160,50 +557,110 @@ def _clean_handspeak_title(raw_title: str) -> str:
     return title
 
 
+# Sidecar next to the Handspeak dictionary: {"last_id", "size"}. Trusted only
+# while the dictionary is still exactly `size` bytes long.
+_LAST_ID_SUFFIX = ".last_id.json"
+
+
+def _save_last_id(path: str, last_id: int) -> None:
+    stamp = _file_stamp(path)
+    if stamp is not None:
+        _save_sidecar(path + _LAST_ID_SUFFIX, {"last_id": last_id, "size": stamp[1]})
+
+
 def get_last_saved_handspeak_id(path: str = HAND_SPEAK_DICT_PATH) -> int:
+    stamp = _file_stamp(path)
+    if stamp is None:
+        return 0
+
+    saved = _load_sidecar(path + _LAST_ID_SUFFIX)
+    if saved.get("size") == stamp[1] and isinstance(saved.get("last_id"), int):
+        return saved["last_id"]
+
+    # Missing or stale sidecar: find the id the slow way and record it.
+    # Reuse the parsed records when the index is current; otherwise a plain
+    # scan is cheaper than building a whole index just for the ids.
+    cached = _DICT_CACHE.get(path)
+    if cached is not None and cached.stamp == _file_stamp(path):
+        records: Iterable[Dict] = cached.records
+    else:
+        records = _iter_jsonl(path)
+
     max_id = 0
-    for obj in _iter_jsonl(path):
+    for obj in records:
         try:
             max_id = max(max_id, int(obj.get("id", 0)))
         except (TypeError, ValueError):
             continue
+
+    _save_last_id(path, max_id)
     return max_id
 
 
-def _parse_handspeak_entry(html: str, entry_id: int, url: str) -> Dict:
-    soup = BeautifulSoup(html, "html.parser")
-    raw_title = (soup.title.get_text(strip=True) if soup.title else "") or ""
-    title = _clean_handspeak_title(raw_title)
+# Handspeak pages only contribute <title> and the canonical link, so pull both
+# straight out of the raw bytes and only build a DOM when the regexes miss.
+_HS_TITLE_RE = re.compile(rb"<title[^>]*>(.*?)</title>", re.I | re.S)
+_HS_CANONICAL_RE = re.compile(rb"<link[^>]*rel=[\"']canonical[\"'][^>]*href=[\"']([^\"']+)", re.I)
+
 
-    canonical = soup.find("link", rel="canonical")
-    canonical_url = canonical.get("href", "") if canonical else ""
+def _parse_handspeak_entry(html: bytes, entry_id: int, url: str) -> Dict:
+    title_m = _HS_TITLE_RE.search(html)
+    canonical_m = _HS_CANONICAL_RE.search(html)
+
+    if title_m is not None and canonical_m is not None:
+        raw_title = unescape(title_m.group(1).decode("utf-8", "replace")).strip()
+        canonical_url = unescape(canonical_m.group(1).decode("utf-8", "replace")).strip()
+    else:
+        doc = _parse_html(html)
+        title_node = _css_first(doc, "title")
+        raw_title = (_node_text(title_node) if title_node else "") or ""
+
+        canonical = _css_first(doc, "link[rel~='canonical']")
+        canonical_url = _node_attr(canonical, "href") if canonical else ""
 
     return {
         "id": entry_id,
         "url": canonical_url or url,
-        "title": title,
+        "title": _clean_handspeak_title(raw_title),
     }
 
 
-def _fetch_handspeak_entry(session: requests.Session, entry_id: int) -> Tuple[Optional[Dict], int]:
+async def _fetch_handspeak_entry(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    entry_id: int,
+) -> Tuple[Optional[Dict], int]:
     url = HAND_SPEAK_URL_TEMPLATE.format(id=entry_id)
-    resp = session.get(url, headers=HEADERS, timeout=20)
 
-    if resp.status_code == 404:
-        return None, 404
+    async with sem:
+        async with session.get(url) as resp:
+            if resp.status == 404:
+                return None, 404
+
+            resp.raise_for_status()
+            status = resp.status
+            html = await resp.read()
 
-    resp.raise_for_status()
-    return _parse_handspeak_entry(resp.text, entry_id=entry_id, url=url), resp.status_code
+    entry = await asyncio.to_thread(_parse_handspeak_entry, html, entry_id=entry_id, url=url)
+    return entry, status
 
 
-def update_handspeak_dict(
+async def update_handspeak_dict(
     *,
     output_path: str = HAND_SPEAK_DICT_PATH,
     start_id: Optional[int] = None,
     max_new: Optional[int] = 500,
     request_delay_seconds: float = REQUEST_DELAY_SECONDS,
     max_consecutive_404: int = MAX_CONSECUTIVE_404,
+    batch_size: int = HAND_SPEAK_BATCH_SIZE,
+    max_concurrency: int = HAND_SPEAK_MAX_CONCURRENCY,
 ) -> UpdateResult:
+    """
+    Fetches Handspeak ids in concurrent windows of `batch_size`, at most
+    `max_concurrency` requests at a time, sleeping `request_delay_seconds`
+    between windows. Results are applied in id order, so the stop conditions
+    behave exactly like a one-id-at-a-time crawl.
+    """
     last_before = get_last_saved_handspeak_id(output_path)
     entry_id = (last_before + 1) if start_id is None else int(start_id)
 
@@ -211,33 +668,51 @@ def update_handspeak_dict(
     consecutive_404 = 0
     last_after = last_before
 
-    with requests.Session() as session:
-        while True:
-            if max_new is not None and wrote >= max_new:
-                return UpdateResult(wrote, last_before, last_after, f"reached max_new={max_new}")
+    sem = asyncio.BoundedSemaphore(max_concurrency)
+    timeout = aiohttp.ClientTimeout(total=UPDATER_TIMEOUT_SECONDS)
+    connector = aiohttp.TCPConnector(limit_per_host=max_concurrency, keepalive_timeout=30)
 
-            try:
-                entry, status = _fetch_handspeak_entry(session, entry_id)
-            except requests.RequestException as e:
-                return UpdateResult(wrote, last_before, last_after, f"request error: {e}")
-
-            if status == 404 or entry is None:
-                consecutive_404 += 1
-                if consecutive_404 >= max_consecutive_404:
-                    return UpdateResult(
-                        wrote,
-                        last_before,
-                        last_after,
-                        f"hit {max_consecutive_404} consecutive 404s",
+    try:
+        async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout, connector=connector) as session:
+            async with _jsonl_writer(output_path) as write:
+                while True:
+                    if max_new is not None and wrote >= max_new:
+                        return UpdateResult(wrote, last_before, last_after, f"reached max_new={max_new}")
+
+                    window = batch_size if max_new is None else min(batch_size, max_new - wrote)
+                    batch_ids = range(entry_id, entry_id + window)
+                    results = await asyncio.gather(
+                        *(_fetch_handspeak_entry(session, sem, i) for i in batch_ids),
+                        return_exceptions=True,
                     )
-            else:
-                consecutive_404 = 0
-                _append_jsonl(output_path, entry)
-                wrote += 1
-                last_after = entry_id
 
-            entry_id += 1
-            time.sleep(request_delay_seconds)
+                    for batch_id, result in zip(batch_ids, results):
+                        if isinstance(result, (aiohttp.ClientError, asyncio.TimeoutError)):
+                            return UpdateResult(wrote, last_before, last_after, f"request error: {result}")
+                        if isinstance(result, BaseException):
+                            raise result
+
+                        entry, status = result
+                        if status == 404 or entry is None:
+                            consecutive_404 += 1
+                            if consecutive_404 >= max_consecutive_404:
+                                return UpdateResult(
+                                    wrote,
+                                    last_before,
+                                    last_after,
+                                    f"hit {max_consecutive_404} consecutive 404s",
+                                )
+                        else:
+                            consecutive_404 = 0
+                            write(entry)
+                            wrote += 1
+                            last_after = batch_id
+
+                    entry_id += window
+                    await asyncio.sleep(request_delay_seconds)
+    finally:
+        # The writer has flushed by now; record the new high-water mark.
+        _save_last_id(output_path, max(last_before, last_after))
 
 
 # =============================
@@ -259,20 +734,25 @@ def _normalize_url(base: str, href: str) -> Optional[str]:
 
 
 def _extract_lifeprint_word_links(html: str, base_url: str) -> list[Dict]:
-    soup = BeautifulSoup(html, "html.parser")
+    doc = _parse_html(html)
     out: list[Dict] = []
 
-    for a in soup.find_all("a", href=True):
-        text = a.get_text(strip=True)
+    # Relative links resolve onto the base page's origin, so the host check is
+    # settled once per page; only URLs elsewhere need parsing per anchor.
+    base = urlparse(base_url)
+    same_origin = f"{base.scheme}://{base.netloc}/" if _is_lifeprint_url(base_url) else None
+
+    for a in _css_all(doc, "a[href]"):
+        text = _node_text(a)
         if not text:
             continue
 
-        href = a.get("href", "")
+        href = _node_attr(a, "href")
         url = _normalize_url(base_url, href)
-        if not url or not _is_lifeprint_url(url):
+        if not url or "/asl101/" not in url:
             continue
 
-        if "/asl101/" not in url:
+        if not (same_origin and url.startswith(same_origin)) and not _is_lifeprint_url(url):
             continue
 
         out.append({"title": text, "url": url})
@@ -280,39 +760,134 @@ def _extract_lifeprint_word_links(html: str, base_url: str) -> list[Dict]:
     return out
 
 
-def update_lifeprint_dict(
+# Sidecar next to the dictionary: letter page url -> {"etag", "last_modified"}.
+_VALIDATORS_SUFFIX = ".validators.json"
+
+
+def _conditional_headers(validators: Optional[Dict[str, str]]) -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+async def _fetch_lifeprint_letter(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    index_url: str,
+    request_delay_seconds: float,
+    validators: Optional[Dict[str, str]] = None,
+) -> Tuple[Optional[list[Dict]], Optional[Dict[str, str]]]:
+    """
+    Returns (records, validators). records is None when the server answered
+    304 Not Modified; validators is None when the page sent none.
+    """
+    async with sem:
+        try:
+            async with session.get(index_url, headers=_conditional_headers(validators)) as resp:
+                if resp.status == 304:
+                    return None, validators
+                if resp.status == 404:
+                    return [], None
+                resp.raise_for_status()
+                body = await resp.read()
+                charset = resp.charset or "utf-8"
+                new_validators = {
+                    "etag": resp.headers.get("ETag", ""),
+                    "last_modified": resp.headers.get("Last-Modified", ""),
+                }
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return [], validators
+        finally:
+            # Hold the slot a little longer to keep per-host pacing polite.
+            await asyncio.sleep(request_delay_seconds)
+
+    try:
+        html = body.decode(charset)
+    except (UnicodeDecodeError, LookupError):
+        # Not valid in the declared (or default UTF-8) charset: read as Windows-1252.
+        html = body.decode("cp1252", errors="replace")
+
+    records = await asyncio.to_thread(_extract_lifeprint_word_links, html, base_url=index_url)
+    return records, new_validators if any(new_validators.values()) else None
+
+
+async def update_lifeprint_dict(
     *,
     output_path: str = LIFEPRINT_DICT_PATH,
     letter_url_template: str = LIFEPRINT_LETTER_URL_TEMPLATE,
     request_delay_seconds: float = REQUEST_DELAY_SECONDS,
+    max_concurrency: int = LIFEPRINT_MAX_CONCURRENCY,
 ) -> Dict:
+    """
+    Fetches all letter index pages concurrently (at most `max_concurrency` at a
+    time), then writes new links from a single writer in letter order.
+
+    Each page's ETag/Last-Modified is kept in a sidecar next to `output_path`
+    and sent back on the next run, so unchanged pages come back as an empty
+    304 and are skipped.
+    """
     saved_urls = _get_saved_urls(output_path)
     wrote = 0
     skipped = 0
 
-    with requests.Session() as session:
-        for letter in string.ascii_lowercase:
-            index_url = letter_url_template.format(letter=letter)
-
-            try:
-                resp = session.get(index_url, headers=HEADERS, timeout=20)
-                if resp.status_code == 404:
-                    continue
-                resp.raise_for_status()
-            except requests.RequestException:
+    validators_path = output_path + _VALIDATORS_SUFFIX
+    # Without saved links a 304 would leave the dictionary empty; refetch all.
+    validators = _load_sidecar(validators_path) if saved_urls else {}
+
+    index_urls = [letter_url_template.format(letter=letter) for letter in string.ascii_lowercase]
+
+    sem = asyncio.Semaphore(max_concurrency)
+    timeout = aiohttp.ClientTimeout(total=UPDATER_TIMEOUT_SECONDS)
+    connector = aiohttp.TCPConnector(limit_per_host=max_concurrency)
+
+    async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout, connector=connector) as session:
+        pages = await asyncio.gather(
+            *(
+                _fetch_lifeprint_letter(session, sem, url, request_delay_seconds, validators.get(url))
+                for url in index_urls
+            ),
+            return_exceptions=True,
+        )
+
+    # A page that failed unexpectedly is treated like a request error: no
+    # links this run, previous validators kept. The other pages still land.
+    for i, (url, page) in enumerate(zip(index_urls, pages)):
+        if isinstance(page, Exception):
+            pages[i] = ([], validators.get(url))
+        elif isinstance(page, BaseException):
+            raise page
+
+    not_modified = 0
+    async with _jsonl_writer(output_path) as write:
+        for records, _ in pages:
+            if records is None:
+                not_modified += 1
                 continue
-
-            for rec in _extract_lifeprint_word_links(resp.text, base_url=index_url):
-                if rec["url"] in saved_urls:
+            for rec in records:
+                url_key = rec["url"].encode()
+                if url_key in saved_urls:
                     skipped += 1
                     continue
-                _append_jsonl(output_path, rec)
-                saved_urls.add(rec["url"])
+                write(rec)
+                saved_urls.add(url_key)
                 wrote += 1
 
-            time.sleep(request_delay_seconds)
+    # Only recorded once the links they vouch for are on disk.
+    _save_sidecar(
+        validators_path,
+        {url: page_validators for url, (_, page_validators) in zip(index_urls, pages) if page_validators},
+    )
 
-    return {"wrote": wrote, "skipped_existing": skipped, "total_saved": len(saved_urls)}
+    return {
+        "wrote": wrote,
+        "skipped_existing": skipped,
+        "not_modified": not_modified,
+        "total_saved": len(saved_urls),
+    }
 
 
 # =============================
@@ -320,13 +895,7 @@ def update_lifeprint_dict(
 # =============================
 
 def load_dictionary_entries(path: str) -> list[Dict]:
-    entries: list[Dict] = []
-    for obj in _iter_jsonl(path):
-        title = obj.get("title")
-        url = obj.get("url")
-        if isinstance(title, str) and isinstance(url, str) and title and url:
-            entries.append(obj)
-    return entries
+    return list(_load_index(path).entries)
 
 
 def perform_web_search(query: str) -> str:
@@ -335,27 +904,28 @@ def perform_web_search(query: str) -> str:
     if not q:
         return "Please provide a search term."
 
-    for obj in _iter_jsonl(LIFEPRINT_DICT_PATH):
-        title = str(obj.get("title", "")).strip()
-        url = str(obj.get("url", "")).strip()
-        if title and url and _title_contains_query_start(title, q):
-            results.append((title, url))
-            if len(results) >= 5:
-                break
-
-    for obj in _iter_jsonl(HAND_SPEAK_DICT_PATH):
-        title = str(obj.get("title", "")).strip()
-        url = str(obj.get("url", "")).strip()
-        if title and url and _title_contains_query_start(title, q):
-            results.append((title, url))
-            if len(results) >= 10:
-                break
+    pattern = _query_start_pattern(q)
+    if pattern is None:
+        return f"No local dictionary matches found for: {query!r}"
+
+    # Lifeprint fills up to 5 slots, Handspeak the rest; only 8 are shown.
+    q_norm = _normalize_title(q)
+    for path, cap in ((LIFEPRINT_DICT_PATH, 5), (HAND_SPEAK_DICT_PATH, 8)):
+        if len(results) >= cap:
+            continue
+        index = _load_index(path)
+        titles_norm = index.titles_norm
+        for i in _candidate_rows(index, q_norm):
+            if pattern.search(titles_norm[i]):
+                results.append((index.titles[i], index.urls[i]))
+                if len(results) >= cap:
+                    break
 
     if not results:
         return f"No local dictionary matches found for: {query!r}"
 
     lines = [f"Results for {query!r}:"]
-    for title, url in results[:8]:
+    for title, url in results:
         lines.append(f"- {title}: {url}")
     return "\n".join(lines)
 
@@ -369,7 +939,7 @@ async def search_aslcore(session, word: str):
     search_url = f"https://aslcore.org/search/?query={_format_query_for_provider(provider, word)}"
 
     try:
-        async with session.get(search_url) as resp:
+        async with _throttled_get(session, search_url) as resp:
             text = await resp.text()
             _log_provider(provider, f"URL={search_url} status={resp.status} bytes={len(text)}")
 
@@ -389,10 +959,6 @@ async def search_aslcore(session, word: str):
         return {"provider": provider, "word": word, "url": None, "found": False}
 
 
-import re
-import json as _json
-
-
 def _normalize_title(s: str) -> str:
     return " ".join((s or "").strip().lower().split())
 
@@ -410,6 +976,11 @@ def _matches_title(title: str, query: str) -> bool:
 
     return False
 
+
+_YT_INITIAL_DATA_RE = re.compile(r"var ytInitialData = (\{.*?\});", re.DOTALL)
+_YT_INITIAL_DATA_LOOSE_RE = re.compile(r"ytInitialData\s*=\s*(\{.*?\});", re.DOTALL)
+
+
 def _extract_youtube_video_renderers(obj):
     if isinstance(obj, dict):
         if "videoRenderer" in obj and isinstance(obj["videoRenderer"], dict):
@@ -430,7 +1001,7 @@ async def search_lifeprint_youtube(session, word: str):
     search_url = f"https://www.youtube.com/@aslu/search?query={_format_query_for_provider(provider, query)}"
 
     try:
-        async with session.get(search_url) as resp:
+        async with _throttled_get(session, search_url) as resp:
             text = await resp.text()
             _log_provider(provider, f"URL={search_url} status={resp.status} bytes={len(text)}")
 
@@ -438,16 +1009,15 @@ async def search_lifeprint_youtube(session, word: str):
                 _log_provider(provider, "Non-200 -> no result")
                 return {"provider": provider, "word": word, "url": None, "found": False}
 
-            m = re.search(r"var ytInitialData = (\{.*?\});", text, re.DOTALL)
-            if not m:
-                m = re.search(r"ytInitialData\s*=\s*(\{.*?\});", text, re.DOTALL)
+            m = _YT_INITIAL_DATA_RE.search(text) or _YT_INITIAL_DATA_LOOSE_RE.search(text)
 
             if not m:
                 _log_provider(provider, "ytInitialData not found -> no result")
                 return {"provider": provider, "word": word, "url": None, "found": False}
 
             try:
-                data = _json.loads(m.group(1))
+                # orjson when available; ytInitialData runs to hundreds of KB.
+                data = _decode_record(m.group(1))
             except Exception as e:
                 _log_provider(provider, f"Failed to parse ytInitialData JSON -> {e}")
                 return {"provider": provider, "word": word, "url": None, "found": False}
@@ -475,12 +1045,15 @@ async def search_lifeprint_youtube(session, word: str):
         return {"provider": provider, "word": word, "url": None, "found": False}
 
 
+_SIGNINGSAVVY_LINK_RE = re.compile(r"""<a\b[^>]*?(?<![\w-])href\s*=\s*["'](/sign/[^"']*)["']""", re.I)
+
+
 async def search_signingsavvy(session, word: str):
     provider = "signingsavvy"
     url = f"https://www.signingsavvy.com/search/{_format_query_for_provider(provider, word)}"
 
     try:
-        async with session.get(url) as resp:
+        async with _throttled_get(session, url) as resp:
             text = await resp.text()
             _log_provider(provider, f"URL={url} status={resp.status} bytes={len(text)}")
 
@@ -488,14 +1061,20 @@ async def search_signingsavvy(session, word: str):
                 _log_provider(provider, "Non-200 -> no result")
                 return {"provider": provider, "word": word, "url": None, "found": False}
 
-            soup = BeautifulSoup(text, "html.parser")
-            link = soup.select_one("a[href^='/sign/']")
+            # Cheap raw-text scan first; only build a DOM if it finds nothing.
+            m = _SIGNINGSAVVY_LINK_RE.search(text)
+            if m:
+                href = unescape(m.group(1))
+            else:
+                doc = await asyncio.to_thread(_parse_html, text)
+                link = _css_first(doc, "a[href^='/sign/']")
+                href = _node_attr(link, "href") if link else ""
 
-            if not link:
+            if not href:
                 _log_provider(provider, "No /sign/ result link found -> no result")
                 return {"provider": provider, "word": word, "url": None, "found": False}
 
-            full_url = "https://www.signingsavvy.com" + link["href"]
+            full_url = "https://www.signingsavvy.com" + href
             _log_provider(provider, f"Found result link: {full_url}")
             return {"provider": provider, "word": word, "url": full_url, "found": True}
 
@@ -509,7 +1088,7 @@ async def search_spreadthesign(session, word: str):
     search_url = f"https://www.spreadthesign.com/en.us/search/?q={_format_query_for_provider(provider, word)}"
 
     try:
-        async with session.get(search_url) as resp:
+        async with _throttled_get(session, search_url) as resp:
             text = await resp.text()
             _log_provider(provider, f"URL={search_url} status={resp.status} bytes={len(text)}")
 
@@ -517,8 +1096,8 @@ async def search_spreadthesign(session, word: str):
                 _log_provider(provider, "Non-200 -> no result")
                 return {"provider": provider, "word": word, "url": None, "found": False}
 
-            soup = BeautifulSoup(text, "html.parser")
-            page_text = soup.get_text(" ", strip=True).lower()
+            doc = await asyncio.to_thread(_parse_html, text)
+            page_text = _page_text(doc)
 
             no_result_phrases = (
                 "no results",
@@ -543,14 +1122,14 @@ async def search_spreadthesign(session, word: str):
                 "a[href*='/en.us/']",
             ]
 
-            found_links = []
+            found_link = None
             for sel in candidate_selectors:
-                found_links = soup.select(sel)
-                if found_links:
-                    _log_provider(provider, f"Found links via selector '{sel}': {len(found_links)}")
+                found_link = _css_first(doc, sel)
+                if found_link:
+                    _log_provider(provider, f"Found link via selector '{sel}'")
                     break
 
-            if found_links:
+            if found_link:
                 return {"provider": provider, "word": word, "url": search_url, "found": True}
 
             _log_provider(provider, "No result markers/links detected -> no result")
@@ -566,7 +1145,7 @@ async def search_signasl(session, word: str):
     search_url = f"https://www.signasl.org/sign/{_format_query_for_provider(provider, word)}"
 
     try:
-        async with session.get(search_url) as resp:
+        async with _throttled_get(session, search_url) as resp:
             text = await resp.text()
             _log_provider(provider, f"URL={search_url} status={resp.status} bytes={len(text)}")
 
@@ -574,8 +1153,13 @@ async def search_signasl(session, word: str):
                 _log_provider(provider, "Non-200 -> no result")
                 return {"provider": provider, "word": word, "url": None, "found": False}
 
-            soup = BeautifulSoup(text, "html.parser")
-            page_text = soup.get_text(" ", strip=True).lower()
+            # SignASL's own miss page says this verbatim; skip parsing entirely.
+            if "No sign found" in text:
+                _log_provider(provider, "Detected 'No sign found' -> no result")
+                return {"provider": provider, "word": word, "url": None, "found": False}
+
+            doc = await asyncio.to_thread(_parse_html, text)
+            page_text = _page_text(doc)
 
             no_result_phrases = (
                 "no sign found",
@@ -590,17 +1174,17 @@ async def search_signasl(session, word: str):
                 _log_provider(provider, "Detected no-result phrase -> no result")
                 return {"provider": provider, "word": word, "url": None, "found": False}
 
-            og_video = soup.find("meta", property="og:video") or soup.find("meta", property="og:video:url")
-            if og_video and og_video.get("content"):
+            og_video = _css_first(doc, "meta[property='og:video'], meta[property='og:video:url']")
+            if og_video is not None and _node_attr(og_video, "content"):
                 _log_provider(provider, "Found og:video meta -> result")
                 return {"provider": provider, "word": word, "url": search_url, "found": True}
 
-            if soup.find("video") or soup.find("source"):
+            if _css_first(doc, "video, source") is not None:
                 _log_provider(provider, "Found <video>/<source> tag -> result")
                 return {"provider": provider, "word": word, "url": search_url, "found": True}
 
-            iframe = soup.find("iframe")
-            if iframe and (iframe.get("src") or ""):
+            iframe = _css_first(doc, "iframe[src]")
+            if iframe is not None and _node_attr(iframe, "src"):
                 _log_provider(provider, "Found <iframe> -> result")
                 return {"provider": provider, "word": word, "url": search_url, "found": True}
 
@@ -618,7 +1202,7 @@ async def search_tachyo(session, word: str):
     search_url = f"https://www.tachyo.org/?q={query}"
 
     try:
-        async with session.get(search_url) as resp:
+        async with _throttled_get(session, search_url) as resp:
             text = await resp.text()
             _log_provider(provider, f"URL={search_url} status={resp.status} bytes={len(text)}")
 
@@ -626,7 +1210,8 @@ async def search_tachyo(session, word: str):
                 _log_provider(provider, "Non-200 -> no result")
                 return {"provider": provider, "word": word, "url": None, "found": False}
 
-            page_text = BeautifulSoup(text, "html.parser").get_text(" ", strip=True).lower()
+            doc = await asyncio.to_thread(_parse_html, text)
+            page_text = _page_text(doc)
             if not page_text or _normalize_title(word) not in page_text:
                 _log_provider(provider, "No query text in reachable page -> no result")
                 return {"provider": provider, "word": word, "url": None, "found": False}
@@ -648,7 +1233,7 @@ async def search_sldictionary(session, word: str):
     direct_url = f"https://www.sldictionary.org/eng/dictionary/{_format_query_for_provider(provider, word)}"
 
     try:
-        async with session.get(direct_url) as resp:
+        async with _throttled_get(session, direct_url) as resp:
             text = await resp.text()
             _log_provider(provider, f"URL={direct_url} status={resp.status} bytes={len(text)}")
 
@@ -656,8 +1241,8 @@ async def search_sldictionary(session, word: str):
                 _log_provider(provider, "Non-200 -> no result")
                 return {"provider": provider, "word": word, "url": None, "found": False}
 
-            soup = BeautifulSoup(text, "html.parser")
-            page_text = soup.get_text(" ", strip=True).lower()
+            doc = await asyncio.to_thread(_parse_html, text)
+            page_text = _page_text(doc)
 
             no_result_phrases = (
                 "no entries",
@@ -683,7 +1268,7 @@ async def search_youglish(session, word: str):
     search_url = f"https://youglish.com/pronounce/{_format_query_for_provider(provider, word)}/signlanguage/us"
 
     try:
-        async with session.get(search_url) as resp:
+        async with _throttled_get(session, search_url) as resp:
             text = await resp.text()
             _log_provider(provider, f"URL={search_url} status={resp.status} bytes={len(text)}")
 
@@ -691,7 +1276,8 @@ async def search_youglish(session, word: str):
                 _log_provider(provider, "Non-200 -> no result")
                 return {"provider": provider, "word": word, "url": None, "found": False}
 
-            page_text = BeautifulSoup(text, "html.parser").get_text(" ", strip=True).lower()
+            doc = await asyncio.to_thread(_parse_html, text)
+            page_text = _page_text(doc)
             no_result_phrases = (
                 "no results",
                 "no result",
@@ -714,6 +1300,8 @@ async def search_youglish(session, word: str):
 # Core Lookup Logic
 # =============================
 
+# Every provider formats the same query word, so normalize each word once.
+@lru_cache(maxsize=1024)
 def _normalize_word(word: str) -> str:
     return word.strip().lower().strip(string.punctuation)
 
@@ -740,76 +1328,111 @@ def _format_query_for_provider(provider: str, word: str) -> str:
     return quote(normalized, safe="")
 
 
-def _title_contains_query_start(title: str, query: str) -> bool:
+def _query_start_pattern(query: str) -> Optional[re.Pattern]:
+    """
+    Compiled matcher for `query` starting at a word boundary inside an
+    already-normalized title. Build it once per query, not once per record.
+    """
     query_norm = _normalize_title(query)
     if not query_norm:
-        return False
+        return None
 
     escaped = re.escape(query_norm).replace(r"\ ", r"[\s/+\-_]+")
-    return re.search(rf"(?<![a-z0-9]){escaped}", _normalize_title(title)) is not None
+    return re.compile(rf"(?<![a-z0-9]){escaped}")
 
 
-def lookup_local_word(word: str) -> Optional[Dict]:
-    q = _normalize_word(word)
+def _candidate_rows(index: _DictIndex, query_norm: str) -> Iterable[int]:
+    """
+    Rows of `index` that can match _query_start_pattern(query_norm), in file
+    order. Queries whose first word is shorter than the key scan every row.
+    """
+    lead = query_norm.split(" ", 1)[0]
+    if len(lead) < _WORD_START_KEY_LEN:
+        return range(len(index.titles_norm))
+    return index.word_starts.get(lead[:_WORD_START_KEY_LEN], [])
 
-    for obj in _iter_jsonl(LIFEPRINT_DICT_PATH):
-        title = str(obj.get("title", ""))
-        if _matches_title(title, q):
-            return {**obj, "source": "lifeprint"}
 
-    for obj in _iter_jsonl(HAND_SPEAK_DICT_PATH):
-        title = str(obj.get("title", ""))
-        if _matches_title(title, q):
-            return {**obj, "source": "handspeak"}
+def lookup_local_word(word: str) -> Optional[Dict]:
+    key = _normalize_title(_normalize_word(word))
 
-    for obj in _iter_jsonl(ON_DEMAND_DICT_PATH):
-        title = str(obj.get("title", ""))
-        if _matches_title(title, q):
-            return obj
+    for path, source in (
+        (LIFEPRINT_DICT_PATH, "lifeprint"),
+        (HAND_SPEAK_DICT_PATH, "handspeak"),
+    ):
+        hits = _load_index(path).by_title.get(key)
+        if hits:
+            return {**hits[0], "source": source}
 
-    return None
+    hits = _load_index(ON_DEMAND_DICT_PATH).by_title.get(key)
+    if hits:
+        return dict(hits[0])
 
+    return None
 
-async def search_all_providers(
-    word: str,
-    *,
-    strict: Literal["broad", "exact"] = "broad",
-) -> Dict[str, list[Dict]]:
-    q = _normalize_word(word)
-    if strict not in {"broad", "exact"}:
-        strict = "broad"
 
+def _search_local_dicts(q: str, strict: str) -> Tuple[list[Dict], list[Dict], set[str]]:
     results_exact: list[Dict] = []
     results_partial: list[Dict] = []
     seen_urls: set[str] = set()
 
-    # 1) LOCAL DICTIONARIES
+    key = _normalize_title(q)
+    pattern = _query_start_pattern(q) if strict == "broad" else None
     for path, provider in (
         (LIFEPRINT_DICT_PATH, "lifeprint"),
         (HAND_SPEAK_DICT_PATH, "handspeak"),
         (ON_DEMAND_DICT_PATH, "ondemand"),
     ):
-        for obj in _iter_jsonl(path):
-            title = str(obj.get("title", "")).strip()
-            url = str(obj.get("url", "")).strip()
-            if not title or not url or url in seen_urls:
+        index = _load_index(path)
+        exact_hits = index.by_title.get(key, [])
+
+        # Exact matches come straight from the title index.
+        if strict != "broad":
+            for obj in exact_hits:
+                title, url = _clean_title_url(obj)
+                if not title or not url or url in seen_urls:
+                    continue
+                results_exact.append({"provider": provider, "title": title, "url": url})
+                seen_urls.add(url)
+            continue
+
+        # Broad mode walks the rows in file order so URL de-duplication is
+        # unchanged; titles are already normalized. Every exact hit also
+        # matches the pattern, so only the pattern's candidate rows are read.
+        exact_ids = {id(obj) for obj in exact_hits}
+        titles, titles_norm, urls, row_records = index.titles, index.titles_norm, index.urls, index.row_records
+        rows = _candidate_rows(index, key) if pattern is not None else range(len(titles_norm))
+
+        for i in rows:
+            title_norm = titles_norm[i]
+            url = urls[i]
+            if url in seen_urls:
                 continue
 
-            if _matches_title(title, q):
-                results_exact.append({"provider": provider, "title": title, "url": url})
+            if id(row_records[i]) in exact_ids:
+                results_exact.append({"provider": provider, "title": titles[i], "url": url})
                 seen_urls.add(url)
-            elif strict == "broad" and _title_contains_query_start(title, q):
-                results_partial.append({"provider": provider, "title": title, "url": url})
+            elif pattern is not None and pattern.search(title_norm):
+                results_partial.append({"provider": provider, "title": titles[i], "url": url})
                 seen_urls.add(url)
 
-    # ✅ Only search LifePrint YouTube when there is NO local LifePrint exact match.
-    has_lifeprint_local_exact = any(
-        e.get("provider") == "lifeprint" for e in results_exact
-    )
+    return results_exact, results_partial, seen_urls
 
-    # 2) LIVE PROVIDERS
-    async with aiohttp.ClientSession(headers=HEADERS) as session:
-        coros = [
+
+async def search_all_providers(
+    word: str,
+    *,
+    strict: Literal["broad", "exact"] = "broad",
+) -> Dict[str, list[Dict]]:
+    q = _normalize_word(word)
+    if strict not in {"broad", "exact"}:
+        strict = "broad"
+
+    # 1) LIVE PROVIDERS — started first so their network time overlaps the
+    # local dictionary scan below.
+    session = await get_http_session()
+    live_tasks = [
+        asyncio.create_task(coro)
+        for coro in (
             search_signingsavvy(session, q),
             search_signasl(session, q),
             search_aslcore(session, q),
@@ -817,24 +1440,37 @@ async def search_all_providers(
             search_tachyo(session, q),
             search_sldictionary(session, q),
             search_youglish(session, q),
-        ]
+        )
+    ]
 
-        # Only include YouTube if no local LifePrint match.
-        if not has_lifeprint_local_exact:
-            coros.append(search_lifeprint_youtube(session, q))
+    # 2) LOCAL DICTIONARIES (in a worker thread so the live requests keep moving)
+    try:
+        results_exact, results_partial, seen_urls = await asyncio.to_thread(_search_local_dicts, q, strict)
+    except BaseException:
+        for task in live_tasks:
+            task.cancel()
+        raise
 
-        live_results = await asyncio.gather(*coros)
+    # ✅ Only search LifePrint YouTube when there is NO local LifePrint exact match.
+    has_lifeprint_local_exact = any(
+        e.get("provider") == "lifeprint" for e in results_exact
+    )
 
-        for result in live_results:
-            if not result or not result.get("found"):
-                continue
+    if not has_lifeprint_local_exact:
+        live_tasks.append(asyncio.create_task(search_lifeprint_youtube(session, q)))
 
-            url = result.get("url")
-            if not url or url in seen_urls:
-                continue
+    live_results = await asyncio.gather(*live_tasks)
 
-            results_exact.append({"provider": result["provider"], "title": q, "url": url})
-            seen_urls.add(url)
+    for result in live_results:
+        if not result or not result.get("found"):
+            continue
+
+        url = result.get("url")
+        if not url or url in seen_urls:
+            continue
+
+        results_exact.append({"provider": result["provider"], "title": q, "url": url})
+        seen_urls.add(url)
 
     # ✅ Enforce the display order you want
     results_exact.sort(key=lambda e: _provider_sort_key(e.get("provider", "")))